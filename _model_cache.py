@@ -0,0 +1,16 @@
+"""
+Process-wide cache for loaded model components.
+"""
+
+import functools
+import joblib
+
+@functools.lru_cache(maxsize=None)
+def load(path):
+    """Load a joblib file once per process.
+
+    NumPy arrays are memory-mapped read-only, so they are paged in on
+    demand instead of copied to the heap. Every caller gets the same
+    object back, so treat it as read-only.
+    """
+    return joblib.load(path, mmap_mode='r')
@@ -3,7 +3,6 @@ Flask web application for phishing email detection.
 """
 
 import os
-import joblib
 import numpy as np
 from flask import Flask, render_template, request, jsonify
 from wordcloud import WordCloud
@@ -11,6 +10,7 @@ import matplotlib.pyplot as plt
 import base64
 from io import BytesIO
 import json
+from _model_cache import load
 
 app = Flask(__name__)
 
@@ -24,9 +24,9 @@ def load_model_components():
     global model, feature_extractor, scaler
     
     try:
-        model = joblib.load('models/phishing_model.pkl')
-        feature_extractor = joblib.load('models/feature_extractor.pkl')
-        scaler = joblib.load('models/scaler.pkl')
+        model = load('models/phishing_model.pkl')
+        feature_extractor = load('models/feature_extractor.pkl')
+        scaler = load('models/scaler.pkl')
         print("Model components loaded successfully!")
         return True
     except Exception as e:
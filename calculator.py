@@ -10,9 +10,40 @@ Python Version: 3.10+
 
 import re
 import sys
+import functools
 from typing import Union, Tuple
 
 
+# Pattern to match valid mathematical expressions
+EXPRESSION_PATTERN = re.compile(
+    r'^(-?\d*\.?\d+)\s*([\+\-\*/\^]|\*\*)\s*(-?\d*\.?\d+)$'
+)
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_stripped_expression(expression: str) -> Tuple[float, str, float]:
+    """
+    Parse an already stripped expression; see Calculator.parse_expression.
+    
+    Parsing is pure, so results are cached for repeated expressions.
+    """
+    # Check if expression matches valid pattern
+    match = EXPRESSION_PATTERN.match(expression)
+    if not match:
+        raise ValueError("Invalid expression format! Use format: number operator number")
+    
+    # Extract components
+    operand1_str, operator, operand2_str = match.groups()
+    
+    try:
+        operand1 = float(operand1_str)
+        operand2 = float(operand2_str)
+    except ValueError:
+        raise ValueError("Invalid number format in expression!")
+    
+    return operand1, operator, operand2
+
+
 class Calculator:
     """
     A comprehensive calculator class that handles basic arithmetic operations
@@ -29,11 +60,6 @@ class Calculator:
             '**': self.power,
             '^': self.power  # Alternative power operator
         }
-        
-        # Pattern to match valid mathematical expressions
-        self.expression_pattern = re.compile(
-            r'^(-?\d*\.?\d+)\s*([\+\-\*/\^]|\*\*)\s*(-?\d*\.?\d+)$'
-        )
     
     def add(self, a: float, b: float) -> float:
         """Add two numbers."""
@@ -81,23 +107,7 @@ class Calculator:
             ValueError: If expression format is invalid
         """
         # Remove extra whitespace
-        expression = expression.strip()
-        
-        # Check if expression matches valid pattern
-        match = self.expression_pattern.match(expression)
-        if not match:
-            raise ValueError("Invalid expression format! Use format: number operator number")
-        
-        # Extract components
-        operand1_str, operator, operand2_str = match.groups()
-        
-        try:
-            operand1 = float(operand1_str)
-            operand2 = float(operand2_str)
-        except ValueError:
-            raise ValueError("Invalid number format in expression!")
-        
-        return operand1, operator, operand2
+        return _parse_stripped_expression(expression.strip())
     
     def calculate(self, expression: str) -> Union[float, int]:
         """
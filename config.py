@@ -3,99 +3,106 @@ Configuration settings for Phishing Email Detector
 """
 
 import os
+import functools
+from dataclasses import dataclass
 from pathlib import Path
 
 # Base directory
 BASE_DIR = Path(__file__).parent.absolute()
 
-class Config:
-    """Base configuration class."""
-    
+# Model settings
+MODEL_DIR = BASE_DIR / 'models'
+DATA_DIR = BASE_DIR / 'data'
+STATIC_DIR = BASE_DIR / 'static'
+
+# Model file paths
+MODEL_PATH = MODEL_DIR / 'phishing_model.pkl'
+FEATURE_EXTRACTOR_PATH = MODEL_DIR / 'feature_extractor.pkl'
+SCALER_PATH = MODEL_DIR / 'scaler.pkl'
+
+# Supported environments; anything else falls back to development
+ENVIRONMENTS = ('development', 'production', 'testing')
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Application settings, resolved once from the environment."""
+
     # Flask settings
-    SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key-change-in-production'
-    FLASK_ENV = os.environ.get('FLASK_ENV') or 'development'
-    DEBUG = FLASK_ENV == 'development'
-    
+    secret_key: str
+    flask_env: str
+    debug: bool
+    testing: bool = False
+
     # Application settings
-    APP_NAME = 'Phishing Email Detector'
-    APP_VERSION = '1.0.0'
-    
+    app_name: str = 'Phishing Email Detector'
+    app_version: str = '1.0.0'
+
     # Model settings
-    MODEL_DIR = BASE_DIR / 'models'
-    DATA_DIR = BASE_DIR / 'data'
-    STATIC_DIR = BASE_DIR / 'static'
-    
+    model_dir: Path = MODEL_DIR
+    data_dir: Path = DATA_DIR
+    static_dir: Path = STATIC_DIR
+
     # Model file paths
-    MODEL_PATH = MODEL_DIR / 'phishing_model.pkl'
-    FEATURE_EXTRACTOR_PATH = MODEL_DIR / 'feature_extractor.pkl'
-    SCALER_PATH = MODEL_DIR / 'scaler.pkl'
-    
+    model_path: Path = MODEL_PATH
+    feature_extractor_path: Path = FEATURE_EXTRACTOR_PATH
+    scaler_path: Path = SCALER_PATH
+
     # Dataset settings
-    DATASET_PATH = DATA_DIR / 'phishing_dataset.csv'
-    
+    dataset_path: Path = DATA_DIR / 'phishing_dataset.csv'
+
     # ML settings
-    RANDOM_STATE = 42
-    TEST_SIZE = 0.2
-    CV_FOLDS = 5
-    
+    random_state: int = 42
+    test_size: float = 0.2
+    cv_folds: int = 5
+
     # Feature extraction settings
-    MAX_FEATURES = 1000
-    NGRAM_RANGE = (1, 2)
-    
+    max_features: int = 1024  # hashed TF-IDF columns, as in FeatureExtractor
+    ngram_range: tuple = (1, 2)
+
     # Server settings
-    HOST = '0.0.0.0'
-    PORT = int(os.environ.get('PORT', 5000))
-    
+    host: str = '0.0.0.0'
+    port: int = 5000
+
     # Logging settings
-    LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO')
-    
+    log_level: str = 'INFO'
+
     # Security settings
-    MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max file size
-    
+    max_content_length: int = 16 * 1024 * 1024  # 16MB max file size
+
     # API settings
-    API_RATE_LIMIT = '100 per hour'
-    
-    @staticmethod
-    def init_app(app):
+    api_rate_limit: str = '100 per hour'
+
+    @property
+    def paths(self):
+        """Model component paths, in load order."""
+        return (self.model_path, self.feature_extractor_path, self.scaler_path)
+
+    def init_app(self, app):
         """Initialize app with configuration."""
-        pass
-
-class DevelopmentConfig(Config):
-    """Development configuration."""
-    DEBUG = True
-    FLASK_ENV = 'development'
-
-class ProductionConfig(Config):
-    """Production configuration."""
-    DEBUG = False
-    FLASK_ENV = 'production'
-    
-    @classmethod
-    def init_app(cls, app):
-        Config.init_app(app)
-        
-        # Log to stderr in production
-        import logging
-        from logging import StreamHandler
-        file_handler = StreamHandler()
-        file_handler.setLevel(logging.INFO)
-        app.logger.addHandler(file_handler)
-
-class TestingConfig(Config):
-    """Testing configuration."""
-    TESTING = True
-    DEBUG = True
-    FLASK_ENV = 'testing'
-
-# Configuration dictionary
-config = {
-    'development': DevelopmentConfig,
-    'production': ProductionConfig,
-    'testing': TestingConfig,
-    'default': DevelopmentConfig
-}
-
-def get_config():
-    """Get configuration based on environment."""
+        if self.flask_env == 'production':
+            # Log to stderr in production
+            import logging
+            from logging import StreamHandler
+            file_handler = StreamHandler()
+            file_handler.setLevel(logging.INFO)
+            app.logger.addHandler(file_handler)
+
+@functools.cache
+def get_settings():
+    """Get settings based on environment.
+
+    The environment is resolved once per process; call
+    ``get_settings.cache_clear()`` after changing it.
+    """
     env = os.environ.get('FLASK_ENV', 'development')
-    return config.get(env, config['default'])
+    if env not in ENVIRONMENTS:
+        env = 'development'
+
+    return Settings(
+        secret_key=os.environ.get('SECRET_KEY') or 'dev-secret-key-change-in-production',
+        flask_env=env,
+        debug=env != 'production',
+        testing=env == 'testing',
+        port=int(os.environ.get('PORT', 5000)),
+        log_level=os.environ.get('LOG_LEVEL', 'INFO')
+    )
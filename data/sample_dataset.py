@@ -56,21 +56,17 @@ def create_sample_dataset():
         "Your account settings have been updated as requested. The changes will take effect within 24 hours."
     ]
     
-    # Create DataFrame
-    data = []
+    # Create DataFrame (label 1 for phishing, 0 for legitimate)
+    df = pd.DataFrame({
+        'email_text': pd.array(phishing_emails + legitimate_emails, dtype='string'),
+        'label': np.concatenate([
+            np.ones(len(phishing_emails), dtype=np.int8),
+            np.zeros(len(legitimate_emails), dtype=np.int8)
+        ])
+    })
     
-    # Add phishing emails
-    for email in phishing_emails:
-        data.append({'email_text': email, 'label': 1})  # 1 for phishing
-    
-    # Add legitimate emails
-    for email in legitimate_emails:
-        data.append({'email_text': email, 'label': 0})  # 0 for legitimate
-    
-    df = pd.DataFrame(data)
-    
-    # Shuffle the dataset
-    df = df.sample(frac=1).reset_index(drop=True)
+    # Shuffle the dataset with a fixed seed so it is reproducible
+    df = df.sample(frac=1, random_state=42).reset_index(drop=True)
     
     return df
 
@@ -79,5 +75,5 @@ if __name__ == "__main__":
     dataset = create_sample_dataset()
     dataset.to_csv('data/phishing_dataset.csv', index=False)
     print(f"Dataset created with {len(dataset)} samples")
-    print(f"Phishing emails: {sum(dataset['label'])}")
-    print(f"Legitimate emails: {len(dataset) - sum(dataset['label'])}")
+    print(f"Phishing emails: {dataset['label'].sum()}")
+    print(f"Legitimate emails: {len(dataset) - dataset['label'].sum()}")
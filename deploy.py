@@ -3,27 +3,36 @@ Deployment script for Phishing Email Detector
 """
 
 import os
+import shlex
 import subprocess
 import sys
 import argparse
 
-def run_command(command, description):
-    """Run a shell command and handle errors."""
-    print(f"🔄 {description}...")
+def run_command(command, description, capture=False):
+    """Run a command and handle errors.
+    
+    Output streams straight to the terminal unless ``capture`` is set, in
+    which case it is collected and printed once the command finishes.
+    """
+    print(f"🔄 {description}...", flush=True)
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
-        print(f"✅ {description} completed successfully!")
+        result = subprocess.run(shlex.split(command), check=True, capture_output=capture, text=True)
+        print(f"✅ {description} completed successfully!", flush=True)
         if result.stdout:
-            print(result.stdout)
+            print(result.stdout, flush=True)
         return True
     except subprocess.CalledProcessError as e:
-        print(f"❌ {description} failed!")
-        print(f"Error: {e.stderr}")
+        print(f"❌ {description} failed!", flush=True)
+        print(f"Error: {e.stderr or f'exit status {e.returncode}'}", flush=True)
+        return False
+    except FileNotFoundError as e:
+        print(f"❌ {description} failed!", flush=True)
+        print(f"Error: {e}", flush=True)
         return False
 
 def check_prerequisites():
     """Check if all prerequisites are met."""
-    print("🔍 Checking prerequisites...")
+    print("🔍 Checking prerequisites...", flush=True)
     
     # Check if required files exist
     required_files = [
@@ -39,17 +48,17 @@ def check_prerequisites():
             missing_files.append(file_path)
     
     if missing_files:
-        print("❌ Missing required files:")
+        print("❌ Missing required files:", flush=True)
         for file_path in missing_files:
-            print(f"   - {file_path}")
+            print(f"   - {file_path}", flush=True)
         return False
     
-    print("✅ All required files present!")
+    print("✅ All required files present!", flush=True)
     return True
 
 def setup_local():
     """Set up local development environment."""
-    print("🚀 Setting up local development environment...")
+    print("🚀 Setting up local development environment...", flush=True)
     
     if not check_prerequisites():
         return False
@@ -64,27 +73,27 @@ def setup_local():
     
     # Run tests
     if not run_command("python test_app.py", "Running tests"):
-        print("⚠️ Tests failed, but continuing with setup...")
+        print("⚠️ Tests failed, but continuing with setup...", flush=True)
     
-    print("🎉 Local setup completed!")
-    print("Run 'python app.py' to start the application")
+    print("🎉 Local setup completed!", flush=True)
+    print("Run 'python app.py' to start the application", flush=True)
     return True
 
 def deploy_heroku(app_name=None):
     """Deploy to Heroku."""
-    print("🚀 Deploying to Heroku...")
+    print("🚀 Deploying to Heroku...", flush=True)
     
     if not check_prerequisites():
         return False
     
     # Check if Heroku CLI is installed
-    if not run_command("heroku --version", "Checking Heroku CLI"):
-        print("Please install Heroku CLI first: https://devcenter.heroku.com/articles/heroku-cli")
+    if not run_command("heroku --version", "Checking Heroku CLI", capture=True):
+        print("Please install Heroku CLI first: https://devcenter.heroku.com/articles/heroku-cli", flush=True)
         return False
     
     # Login to Heroku
-    if not run_command("heroku auth:whoami", "Checking Heroku authentication"):
-        print("Please login to Heroku first: heroku login")
+    if not run_command("heroku auth:whoami", "Checking Heroku authentication", capture=True):
+        print("Please login to Heroku first: heroku login", flush=True)
         return False
     
     # Create or use existing app
@@ -99,17 +108,17 @@ def deploy_heroku(app_name=None):
         return False
     
     if not run_command("git commit -m 'Deploy to Heroku'", "Committing changes"):
-        print("No changes to commit or already committed")
+        print("No changes to commit or already committed", flush=True)
     
     if not run_command("git push heroku main", "Pushing to Heroku"):
         return False
     
-    print("🎉 Heroku deployment completed!")
+    print("🎉 Heroku deployment completed!", flush=True)
     return True
 
 def build_docker():
     """Build Docker image."""
-    print("🐳 Building Docker image...")
+    print("🐳 Building Docker image...", flush=True)
     
     if not check_prerequisites():
         return False
@@ -118,18 +127,22 @@ def build_docker():
     if not run_command("docker build -t phishing-detector .", "Building Docker image"):
         return False
     
-    print("🎉 Docker image built successfully!")
-    print("Run 'docker run -p 5000:5000 phishing-detector' to start the container")
+    print("🎉 Docker image built successfully!", flush=True)
+    print("Run 'docker run -p 5000:5000 phishing-detector' to start the container", flush=True)
     return True
 
 def run_docker():
     """Run Docker container."""
-    print("🐳 Running Docker container...")
+    print("🐳 Running Docker container...", flush=True)
     
-    if not run_command("docker run -p 5000:5000 phishing-detector", "Running Docker container"):
+    # Replace this process with docker so its output and signals (Ctrl-C)
+    # go straight to the container; this only returns if docker is missing
+    try:
+        os.execvp('docker', ['docker', 'run', '-p', '5000:5000', 'phishing-detector'])
+    except OSError as e:
+        print("❌ Running Docker container failed!", flush=True)
+        print(f"Error: {e}", flush=True)
         return False
-    
-    return True
 
 def main():
     """Main deployment function."""
@@ -140,8 +153,8 @@ def main():
     
     args = parser.parse_args()
     
-    print("🛡️ Phishing Email Detector Deployment")
-    print("=" * 50)
+    print("🛡️ Phishing Email Detector Deployment", flush=True)
+    print("=" * 50, flush=True)
     
     success = False
     
@@ -154,11 +167,11 @@ def main():
     elif args.action == 'docker-run':
         success = run_docker()
     
-    print("=" * 50)
+    print("=" * 50, flush=True)
     if success:
-        print("🎉 Deployment completed successfully!")
+        print("🎉 Deployment completed successfully!", flush=True)
     else:
-        print("❌ Deployment failed!")
+        print("❌ Deployment failed!", flush=True)
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -4,17 +4,28 @@ Feature extraction utilities for phishing email detection.
 
 import re
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
+import pandas as pd
+from scipy import sparse
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+from sklearn.pipeline import Pipeline
 from data_preprocessor import EmailPreprocessor
 
 class FeatureExtractor:
     def __init__(self):
         self.preprocessor = EmailPreprocessor()
-        self.tfidf_vectorizer = TfidfVectorizer(
-            max_features=1000,
-            ngram_range=(1, 2),
-            stop_words='english'
-        )
+        # Hash tokens into a fixed number of columns, so fitting only has to
+        # learn the IDF weights and no vocabulary is stored
+        self.tfidf_vectorizer = Pipeline([
+            ('hash', HashingVectorizer(
+                n_features=1024,
+                ngram_range=(1, 2),
+                stop_words='english',
+                alternate_sign=False,
+                norm=None,
+                dtype=np.float32
+            )),
+            ('tfidf', TfidfTransformer())
+        ])
         self.suspicious_words = [
             'urgent', 'immediate', 'act now', 'limited time', 'expires',
             'click here', 'click now', 'verify', 'confirm', 'update',
@@ -28,10 +39,22 @@ class FeatureExtractor:
             'incredible', 'unbelievable', 'fantastic', 'wonderful'
         ]
         
+        # Match every suspicious word in one pass: the lookahead captures the
+        # longest word starting at each position, and the closure maps it to
+        # all suspicious words it contains (e.g. 'suspended' -> 'suspend')
+        self._suspicious_words_lower = tuple(word.lower() for word in self.suspicious_words)
+        words = sorted(set(self._suspicious_words_lower), key=len, reverse=True)
+        self._suspicious_re = re.compile('(?=(' + '|'.join(map(re.escape, words)) + '))')
+        self._suspicious_closure = {
+            word: frozenset(other for other in words if other in word) for word in words
+        }
+        self._upper_re = re.compile(r'[A-Z]')
+        self._sentence_re = re.compile(r'[.!?]+')
+        
     def extract_basic_features(self, email_text):
         """Extract basic statistical features from email text."""
         if not email_text:
-            return np.zeros(8)
+            return np.zeros(7, dtype=np.float32)
         
         # Text length
         text_length = len(email_text)
@@ -39,9 +62,6 @@ class FeatureExtractor:
         # Word count
         word_count = len(email_text.split())
         
-        # Character count
-        char_count = len(email_text)
-        
         # Number of URLs
         urls = self.preprocessor.extract_urls(email_text)
         url_count = len(urls)
@@ -51,31 +71,33 @@ class FeatureExtractor:
         email_count = len(emails)
         
         # Number of suspicious words
-        suspicious_count = sum(1 for word in self.suspicious_words 
-                             if word.lower() in email_text.lower())
+        found = set()
+        for match in self._suspicious_re.findall(email_text.lower()):
+            found |= self._suspicious_closure[match]
+        suspicious_count = len(found)
         
         # Ratio of uppercase letters
-        uppercase_ratio = sum(1 for c in email_text if c.isupper()) / max(len(email_text), 1)
+        uppercase_ratio = len(self._upper_re.findall(email_text)) / max(len(email_text), 1)
         
         # Number of exclamation marks
         exclamation_count = email_text.count('!')
         
         return np.array([
-            text_length, word_count, char_count, url_count,
+            text_length, word_count, url_count,
             email_count, suspicious_count, uppercase_ratio, exclamation_count
-        ])
+        ], dtype=np.float32)
     
     def extract_advanced_features(self, email_text):
         """Extract advanced linguistic features."""
         if not email_text:
-            return np.zeros(5)
+            return np.zeros(5, dtype=np.float32)
         
         # Average word length
         words = email_text.split()
         avg_word_length = np.mean([len(word) for word in words]) if words else 0
         
         # Number of sentences
-        sentence_count = len(re.split(r'[.!?]+', email_text))
+        sentence_count = len(self._sentence_re.split(email_text))
         
         # Average sentence length
         avg_sentence_length = len(words) / max(sentence_count, 1)
@@ -84,44 +106,106 @@ class FeatureExtractor:
         question_count = email_text.count('?')
         
         # Number of capital letters
-        capital_count = sum(1 for c in email_text if c.isupper())
+        capital_count = len(self._upper_re.findall(email_text))
         
         return np.array([
             avg_word_length, sentence_count, avg_sentence_length,
             question_count, capital_count
-        ])
+        ], dtype=np.float32)
+    
+    def compute_stats_batch(self, texts):
+        """Compute basic and advanced features for a pandas Series of emails.
+        
+        Returns a float32 array of shape (N, 12) whose rows match
+        ``extract_basic_features`` followed by ``extract_advanced_features``.
+        """
+        # Object dtype keeps the .str methods on Python's re; pyarrow-backed
+        # strings would run them on RE2, whose \s and \w are ASCII-only
+        texts = texts.fillna('').astype(str).astype(object)
+        lower = texts.str.lower()
+        
+        text_length = texts.str.len()
+        word_count = texts.str.split().str.len()
+        url_count = texts.str.count(self.preprocessor._url_re)
+        email_count = texts.str.count(self.preprocessor._email_re)
+        suspicious_count = sum(lower.str.contains(word, regex=False)
+                               for word in self._suspicious_words_lower)
+        capital_count = texts.str.count(self._upper_re)
+        uppercase_ratio = capital_count / text_length.clip(lower=1)
+        exclamation_count = texts.str.count(re.escape('!'))
+        
+        # Words are the non-whitespace runs, so their total length is the
+        # number of non-whitespace characters
+        word_chars = text_length - texts.str.count(r'\s')
+        avg_word_length = (word_chars / word_count.where(word_count > 0)).fillna(0)
+        sentence_count = texts.str.count(self._sentence_re) + 1
+        avg_sentence_length = word_count / sentence_count
+        question_count = texts.str.count(re.escape('?'))
+        
+        stats = np.column_stack([
+            text_length, word_count, url_count,
+            email_count, suspicious_count, uppercase_ratio, exclamation_count,
+            avg_word_length, sentence_count, avg_sentence_length,
+            question_count, capital_count
+        ]).astype(np.float32)
+        
+        # Empty emails get all-zero features, as in the per-email extractors
+        stats[(text_length == 0).to_numpy()] = 0
+        return stats
     
-    def fit_tfidf(self, email_texts):
-        """Fit TF-IDF vectorizer on training data."""
-        processed_texts = [self.preprocessor.preprocess_email(text) for text in email_texts]
+    def fit_tfidf(self, email_texts, processed_texts=None):
+        """Fit TF-IDF vectorizer on training data.
+        
+        Returns the preprocessed texts so callers can reuse them.
+        """
+        if processed_texts is None:
+            processed_texts = self.preprocessor.preprocess_batch(pd.Series(email_texts)).tolist()
         self.tfidf_vectorizer.fit(processed_texts)
+        return processed_texts
         
-    def extract_tfidf_features(self, email_text):
+    def extract_tfidf_features(self, email_text, processed_text=None):
         """Extract TF-IDF features from email text."""
-        processed_text = self.preprocessor.preprocess_email(email_text)
+        if processed_text is None:
+            processed_text = self.preprocessor.preprocess_email(email_text)
         tfidf_features = self.tfidf_vectorizer.transform([processed_text])
         return tfidf_features.toarray()[0]
     
-    def extract_all_features(self, email_text):
+    def extract_all_features(self, email_text, processed_text=None):
         """Extract all features from email text."""
         basic_features = self.extract_basic_features(email_text)
         advanced_features = self.extract_advanced_features(email_text)
-        tfidf_features = self.extract_tfidf_features(email_text)
+        tfidf_features = self.extract_tfidf_features(email_text, processed_text)
         
         # Combine all features
         all_features = np.concatenate([basic_features, advanced_features, tfidf_features])
         return all_features
     
+    def extract_all_features_batch(self, emails, processed_texts=None):
+        """Extract all features for a list of emails as one matrix.
+        
+        Row ``i`` equals ``extract_all_features(emails[i])``; the TF-IDF part
+        is computed with a single vectorizer call over the whole batch. The
+        result is a CSR sparse matrix, as most TF-IDF entries are zero.
+        """
+        if processed_texts is None:
+            processed_texts = self.preprocessor.preprocess_batch(pd.Series(emails)).tolist()
+        
+        stat_features = self.compute_stats_batch(pd.Series(emails))
+        tfidf_features = self.tfidf_vectorizer.transform(processed_texts)
+        
+        return sparse.hstack([sparse.csr_matrix(stat_features), tfidf_features], format='csr')
+    
     def get_feature_names(self):
         """Get names of all features."""
         basic_names = [
-            'text_length', 'word_count', 'char_count', 'url_count',
+            'text_length', 'word_count', 'url_count',
             'email_count', 'suspicious_count', 'uppercase_ratio', 'exclamation_count'
         ]
         advanced_names = [
             'avg_word_length', 'sentence_count', 'avg_sentence_length',
             'question_count', 'capital_count'
         ]
-        tfidf_names = [f'tfidf_{i}' for i in range(len(self.tfidf_vectorizer.get_feature_names_out()))]
+        n_hashed = self.tfidf_vectorizer.named_steps['hash'].n_features
+        tfidf_names = [f'hash_{i}' for i in range(n_hashed)]
         
         return basic_names + advanced_names + tfidf_names
@@ -6,27 +6,35 @@ import unittest
 import json
 import os
 import sys
-import joblib
+import numpy as np
+import pandas as pd
+import app as app_module
 from app import app
 
 class TestPhishingDetector(unittest.TestCase):
     
-    def setUp(self):
-        """Set up test client."""
-        self.app = app.test_client()
-        self.app.testing = True
-        
-        # Sample test emails
-        self.phishing_email = """
+    # Sample test emails
+    phishing_email = """
         URGENT: Your account will be suspended! Click here immediately to verify 
         your information and avoid account closure. Act now before it's too late!
         """
-        
-        self.legitimate_email = """
+    
+    legitimate_email = """
         Thank you for your recent purchase. Your order #12345 has been shipped 
         and will arrive within 3-5 business days.
         """
     
+    @classmethod
+    def setUpClass(cls):
+        """Set up one test client shared by all tests in the class."""
+        cls.app = app.test_client()
+        cls.app.testing = True
+        
+        # Request bodies are constant, so encode them once
+        cls.phishing_payload = json.dumps({'email_text': cls.phishing_email}).encode()
+        cls.legitimate_payload = json.dumps({'email_text': cls.legitimate_email}).encode()
+        cls.empty_payload = json.dumps({'email_text': ''}).encode()
+    
     def test_home_page(self):
         """Test home page loads correctly."""
         response = self.app.get('/')
@@ -53,7 +61,7 @@ class TestPhishingDetector(unittest.TestCase):
     def test_predict_phishing_email(self):
         """Test prediction for phishing email."""
         response = self.app.post('/predict',
-                                data=json.dumps({'email_text': self.phishing_email}),
+                                data=self.phishing_payload,
                                 content_type='application/json')
         
         if response.status_code == 200:
@@ -68,7 +76,7 @@ class TestPhishingDetector(unittest.TestCase):
     def test_predict_legitimate_email(self):
         """Test prediction for legitimate email."""
         response = self.app.post('/predict',
-                                data=json.dumps({'email_text': self.legitimate_email}),
+                                data=self.legitimate_payload,
                                 content_type='application/json')
         
         if response.status_code == 200:
@@ -83,7 +91,7 @@ class TestPhishingDetector(unittest.TestCase):
     def test_predict_empty_email(self):
         """Test prediction with empty email."""
         response = self.app.post('/predict',
-                                data=json.dumps({'email_text': ''}),
+                                data=self.empty_payload,
                                 content_type='application/json')
         
         self.assertEqual(response.status_code, 400)
@@ -106,22 +114,26 @@ class TestModelComponents(unittest.TestCase):
             'models/scaler.pkl'
         ]
         
+        # One directory listing instead of a stat per file
+        entries = set(os.listdir('models')) if os.path.isdir('models') else set()
         for file_path in model_files:
-            self.assertTrue(os.path.exists(file_path), f"Model file {file_path} does not exist")
+            self.assertIn(os.path.basename(file_path), entries,
+                          f"Model file {file_path} does not exist")
     
     def test_model_loading(self):
-        """Test that models can be loaded."""
-        try:
-            model = joblib.load('models/phishing_model.pkl')
-            feature_extractor = joblib.load('models/feature_extractor.pkl')
-            scaler = joblib.load('models/scaler.pkl')
-            
-            self.assertIsNotNone(model)
-            self.assertIsNotNone(feature_extractor)
-            self.assertIsNotNone(scaler)
-            
-        except Exception as e:
-            self.fail(f"Failed to load model components: {e}")
+        """Test that the app can load its model components."""
+        # Reuse the app's own loader and globals instead of unpickling again,
+        # restoring the globals afterwards so other tests do not depend on
+        # whether this one ran first
+        for name in ('model', 'feature_extractor', 'scaler'):
+            self.addCleanup(setattr, app_module, name, getattr(app_module, name))
+        
+        self.assertTrue(app_module.load_model_components(),
+                        "Failed to load model components")
+        
+        self.assertIsNotNone(app_module.model)
+        self.assertIsNotNone(app_module.feature_extractor)
+        self.assertIsNotNone(app_module.scaler)
 
 class TestFeatureExtraction(unittest.TestCase):
     
@@ -146,6 +158,23 @@ class TestFeatureExtraction(unittest.TestCase):
         features = self.feature_extractor.extract_basic_features("")
         self.assertIsInstance(features, type(features))
 
+    def test_batch_stats_match_single(self):
+        """Test batch statistics match per-email basic and advanced features."""
+        emails = [
+            "URGENT: Verify your account at https://phishing.com NOW!",
+            "Thank you for your order. Contact support@example.com?",
+            "hello\xa0world  café naïve, write to josé@exámple.com",
+            ""
+        ]
+        stats = self.feature_extractor.compute_stats_batch(pd.Series(emails))
+
+        for row, email in zip(stats, emails):
+            expected = np.concatenate([
+                self.feature_extractor.extract_basic_features(email),
+                self.feature_extractor.extract_advanced_features(email)
+            ])
+            np.testing.assert_allclose(row, expected, rtol=1e-6)
+
 class TestDataPreprocessing(unittest.TestCase):
     
     def setUp(self):
@@ -179,25 +208,25 @@ class TestDataPreprocessing(unittest.TestCase):
         
         self.assertIsInstance(processed, str)
 
+    def test_batch_preprocessing(self):
+        """Test batch preprocessing matches per-email preprocessing."""
+        emails = [
+            "<p>URGENT: Click https://phishing.com NOW!</p>",
+            "Contact support@example.com about your order #12345.",
+            ""
+        ]
+        processed = self.preprocessor.preprocess_batch(pd.Series(emails))
+
+        self.assertEqual(processed.tolist(),
+                         [self.preprocessor.preprocess_email(email) for email in emails])
+
 def run_tests():
     """Run all tests."""
     print("🧪 Running Phishing Email Detector Tests...")
     print("=" * 50)
     
-    # Create test suite
-    test_suite = unittest.TestSuite()
-    
-    # Add test classes
-    test_classes = [
-        TestPhishingDetector,
-        TestModelComponents,
-        TestFeatureExtraction,
-        TestDataPreprocessing
-    ]
-    
-    for test_class in test_classes:
-        tests = unittest.TestLoader().loadTestsFromTestCase(test_class)
-        test_suite.addTests(tests)
+    # Create test suite from every test class in this module
+    test_suite = unittest.defaultTestLoader.loadTestsFromModule(sys.modules[__name__])
     
     # Run tests
     runner = unittest.TextTestRunner(verbosity=2)
@@ -14,6 +14,19 @@ from calculator import Calculator
 class TestCalculator(unittest.TestCase):
     """Test cases for the Calculator class."""
     
+    # Expressions the parser must reject with ValueError
+    _INVALID = (
+        "5 +",           # Missing operand
+        "+ 3",           # Missing operand
+        "5 + 3 + 2",     # Too many operands
+        "5 & 3",         # Invalid operator
+        "abc + 3",       # Invalid number
+        "5 + def",       # Invalid number
+        "",              # Empty string
+        "5 ++ 3",        # Invalid operator
+        "5.5.5 + 3",     # Invalid number format
+    )
+    
     def setUp(self):
         """Set up test fixtures before each test method."""
         self.calc = Calculator()
@@ -84,19 +97,7 @@ class TestCalculator(unittest.TestCase):
     
     def test_invalid_expressions(self):
         """Test error handling for invalid expressions."""
-        invalid_expressions = [
-            "5 +",           # Missing operand
-            "+ 3",           # Missing operand
-            "5 + 3 + 2",     # Too many operands
-            "5 & 3",         # Invalid operator
-            "abc + 3",       # Invalid number
-            "5 + def",       # Invalid number
-            "",              # Empty string
-            "5 ++ 3",        # Invalid operator
-            "5.5.5 + 3",     # Invalid number format
-        ]
-        
-        for expr in invalid_expressions:
+        for expr in self._INVALID:
             with self.assertRaises(ValueError, msg=f"Should raise ValueError for: {expr}"):
                 self.calc.calculate(expr)
     
@@ -139,22 +140,30 @@ class TestCalculatorIntegration(unittest.TestCase):
         """Set up test fixtures."""
         self.calc = Calculator()
     
-    def test_calculator_workflow(self):
-        """Test a typical calculator workflow."""
-        # Test a series of calculations
-        test_cases = [
-            ("5 + 3", 8),
-            ("10 - 4", 6),
-            ("6 * 7", 42),
-            ("15 / 3", 5),
-            ("2 ** 3", 8),
-            ("3 ^ 2", 9),
-        ]
-        
-        for expression, expected in test_cases:
-            with self.subTest(expression=expression):
-                result = self.calc.calculate(expression)
-                self.assertEqual(result, expected)
+    # A typical calculator workflow, one step per test
+    def test_workflow_addition(self):
+        """Test calculator workflow: 5 + 3."""
+        self.assertEqual(self.calc.calculate("5 + 3"), 8)
+    
+    def test_workflow_subtraction(self):
+        """Test calculator workflow: 10 - 4."""
+        self.assertEqual(self.calc.calculate("10 - 4"), 6)
+    
+    def test_workflow_multiplication(self):
+        """Test calculator workflow: 6 * 7."""
+        self.assertEqual(self.calc.calculate("6 * 7"), 42)
+    
+    def test_workflow_division(self):
+        """Test calculator workflow: 15 / 3."""
+        self.assertEqual(self.calc.calculate("15 / 3"), 5)
+    
+    def test_workflow_power(self):
+        """Test calculator workflow: 2 ** 3."""
+        self.assertEqual(self.calc.calculate("2 ** 3"), 8)
+    
+    def test_workflow_caret_power(self):
+        """Test calculator workflow: 3 ^ 2."""
+        self.assertEqual(self.calc.calculate("3 ^ 2"), 9)
 
 
 def run_manual_tests():
@@ -4,71 +4,169 @@ Verification script to check if the Phishing Email Detector is properly set up.
 """
 
 import os
+import stat
 import sys
-import importlib
+import functools
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-def check_file_exists(file_path, description):
-    """Check if a file exists."""
-    if os.path.exists(file_path):
-        print(f"✅ {description}: {file_path}")
-        return True
+# Distribution names whose import name differs
+PACKAGE_IMPORT_NAMES = {
+    'scikit-learn': 'sklearn',
+}
+
+# Files to verify: (section title, whether missing files fail verification,
+# (path, description) pairs)
+FILE_CHECKS = (
+    ("📁 Core Application Files", True, (
+        ('app.py', 'Main Flask application'),
+        ('model_trainer.py', 'Model training script'),
+        ('feature_extractor.py', 'Feature extraction module'),
+        ('data_preprocessor.py', 'Data preprocessing module'),
+        ('requirements.txt', 'Python dependencies'),
+    )),
+    ("🎨 Frontend Files", True, (
+        ('templates/index.html', 'Main HTML template'),
+        ('static/style.css', 'CSS stylesheet'),
+        ('static/script.js', 'JavaScript file'),
+    )),
+    ("🚀 Deployment Files", True, (
+        ('Procfile', 'Heroku process file'),
+        ('Dockerfile', 'Docker configuration'),
+        ('render.yaml', 'Render deployment config'),
+        ('runtime.txt', 'Python runtime specification'),
+    )),
+    # These are not critical for basic functionality
+    ("🛠️ Utility Files", False, (
+        ('setup.py', 'Setup script'),
+        ('test_app.py', 'Test script'),
+        ('cli.py', 'Command line interface'),
+        ('config.py', 'Configuration file'),
+        ('deploy.py', 'Deployment script'),
+    )),
+)
+
+# Leading bytes of a loadable model file: a protocol 4/5 pickle (how
+# model_trainer dumps), or a joblib compressed file (the prefixes in
+# joblib/compressor.py: zlib, gzip, bz2, lzma, xz, lz4)
+MODEL_FILE_HEADERS = (
+    b'\x80\x04', b'\x80\x05',
+    b'x', b'\x1f\x8b', b'BZ', b']\x00', b'\xfd7zXZ', b'\x04"M\x18',
+)
+
+DIRECTORY_CHECKS = (
+    ('data', 'Data directory'),
+    ('models', 'Models directory'),
+    ('static', 'Static files directory'),
+    ('templates', 'Templates directory'),
+)
+
+def emit(lines):
+    """Write report lines to stdout in a single write call."""
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+@functools.lru_cache(maxsize=None)
+def _stat(path):
+    """Return os.stat() for a path, or None if it cannot be stat'ed.
+    
+    Each path is stat'ed once per run, however many checks ask about it.
+    """
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+def file_status(file_path, description):
+    """Return whether a file exists and the line reporting it."""
+    st = _stat(file_path)
+    if st is not None and stat.S_ISREG(st.st_mode):
+        return True, f"✅ {description}: {file_path}"
     else:
-        print(f"❌ {description}: {file_path} (MISSING)")
-        return False
+        return False, f"❌ {description}: {file_path} (MISSING)"
 
-def check_directory_exists(dir_path, description):
-    """Check if a directory exists."""
-    if os.path.exists(dir_path) and os.path.isdir(dir_path):
-        print(f"✅ {description}: {dir_path}")
-        return True
+def directory_status(dir_path, description):
+    """Return whether a directory exists and the line reporting it."""
+    st = _stat(dir_path)
+    if st is not None and stat.S_ISDIR(st.st_mode):
+        return True, f"✅ {description}: {dir_path}"
     else:
-        print(f"❌ {description}: {dir_path} (MISSING)")
-        return False
+        return False, f"❌ {description}: {dir_path} (MISSING)"
 
-def check_python_package(package_name):
-    """Check if a Python package is installed."""
-    try:
-        importlib.import_module(package_name)
-        print(f"✅ Python package: {package_name}")
-        return True
-    except ImportError:
-        print(f"❌ Python package: {package_name} (NOT INSTALLED)")
-        return False
+def check_section(title, required, items, status=file_status):
+    """Run one section of checks.
+    
+    Returns the section title, whether it is required, its report lines
+    and whether every check passed.
+    """
+    lines = [f"\n{title}:"]
+    ok = True
+    for path, description in items:
+        passed, line = status(path, description)
+        lines.append(line)
+        if not passed:
+            ok = False
+    return title, required, lines, ok
+
+def package_status(package_name):
+    """Return whether a Python package is installed and the line reporting it."""
+    # Locate the package without executing it; importing the ML stack
+    # would take seconds
+    import_name = PACKAGE_IMPORT_NAMES.get(package_name, package_name)
+    if importlib.util.find_spec(import_name) is not None:
+        return True, f"✅ Python package: {package_name}"
+    else:
+        return False, f"❌ Python package: {package_name} (NOT INSTALLED)"
+
+def _sniff(file_path):
+    """Return whether a file starts like a model file, without loading it."""
+    with open(file_path, 'rb') as f:
+        return f.read(8).startswith(MODEL_FILE_HEADERS)
 
 def check_model_files():
-    """Check if model files exist and can be loaded."""
+    """Check if model files exist and look loadable."""
     model_files = [
         'models/phishing_model.pkl',
         'models/feature_extractor.pkl',
         'models/scaler.pkl'
     ]
     
+    lines = []
     all_exist = True
     for file_path in model_files:
-        if not check_file_exists(file_path, "Model file"):
+        passed, line = file_status(file_path, "Model file")
+        lines.append(line)
+        if not passed:
             all_exist = False
     
+    valid = False
     if all_exist:
+        # Only read the file headers; the web app check does the full load
         try:
-            import joblib
-            model = joblib.load('models/phishing_model.pkl')
-            feature_extractor = joblib.load('models/feature_extractor.pkl')
-            scaler = joblib.load('models/scaler.pkl')
-            print("✅ Model files can be loaded successfully")
-            return True
-        except Exception as e:
-            print(f"❌ Error loading model files: {e}")
-            return False
+            bad_files = [file_path for file_path in model_files if not _sniff(file_path)]
+            if bad_files:
+                lines.append(f"❌ Not valid model files: {', '.join(bad_files)}")
+            else:
+                lines.append("✅ Model files look valid")
+                valid = True
+        except OSError as e:
+            lines.append(f"❌ Error reading model files: {e}")
     
-    return False
+    emit(lines)
+    return valid
 
 def check_web_app():
     """Check if the web application can be imported."""
     try:
-        from app import app
+        from app import app, load_model_components
         print("✅ Flask app can be imported")
         
+        if load_model_components():
+            print("✅ Model components load in the app")
+        else:
+            print("❌ Model components could not be loaded")
+            return False
+        
         # Test basic routes
         with app.test_client() as client:
             response = client.get('/')
@@ -97,85 +195,40 @@ def main():
     
     all_checks_passed = True
     
-    # Check core application files
-    print("\n📁 Core Application Files:")
-    core_files = [
-        ('app.py', 'Main Flask application'),
-        ('model_trainer.py', 'Model training script'),
-        ('feature_extractor.py', 'Feature extraction module'),
-        ('data_preprocessor.py', 'Data preprocessing module'),
-        ('requirements.txt', 'Python dependencies'),
-    ]
-    
-    for file_path, description in core_files:
-        if not check_file_exists(file_path, description):
-            all_checks_passed = False
-    
-    # Check template and static files
-    print("\n🎨 Frontend Files:")
-    frontend_files = [
-        ('templates/index.html', 'Main HTML template'),
-        ('static/style.css', 'CSS stylesheet'),
-        ('static/script.js', 'JavaScript file'),
-    ]
-    
-    for file_path, description in frontend_files:
-        if not check_file_exists(file_path, description):
-            all_checks_passed = False
+    # Check the file and directory sections concurrently; the work is
+    # filesystem metadata lookups, which release the GIL
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(check_section, title, required, files)
+                   for title, required, files in FILE_CHECKS]
+        futures.append(executor.submit(check_section, "📂 Directories", True,
+                                       DIRECTORY_CHECKS, directory_status))
+        results = [future.result() for future in futures]
     
-    # Check deployment files
-    print("\n🚀 Deployment Files:")
-    deployment_files = [
-        ('Procfile', 'Heroku process file'),
-        ('Dockerfile', 'Docker configuration'),
-        ('render.yaml', 'Render deployment config'),
-        ('runtime.txt', 'Python runtime specification'),
-    ]
-    
-    for file_path, description in deployment_files:
-        if not check_file_exists(file_path, description):
+    # Report in table order, all at once
+    lines = []
+    for title, required, section_lines, ok in results:
+        lines.extend(section_lines)
+        if required and not ok:
             all_checks_passed = False
     
-    # Check utility files
-    print("\n🛠️ Utility Files:")
-    utility_files = [
-        ('setup.py', 'Setup script'),
-        ('test_app.py', 'Test script'),
-        ('cli.py', 'Command line interface'),
-        ('config.py', 'Configuration file'),
-        ('deploy.py', 'Deployment script'),
-    ]
-    
-    for file_path, description in utility_files:
-        if not check_file_exists(file_path, description):
-            # These are not critical for basic functionality
-            pass
-    
-    # Check directories
-    print("\n📂 Directories:")
-    directories = [
-        ('data', 'Data directory'),
-        ('models', 'Models directory'),
-        ('static', 'Static files directory'),
-        ('templates', 'Templates directory'),
-    ]
-    
-    for dir_path, description in directories:
-        if not check_directory_exists(dir_path, description):
-            all_checks_passed = False
+    emit(lines)
     
     # Check Python packages
-    print("\n🐍 Python Packages:")
+    lines = ["\n🐍 Python Packages:"]
     required_packages = [
-        'flask', 'pandas', 'numpy', 'sklearn', 'nltk', 
-        'beautifulsoup4', 'joblib', 'matplotlib', 'seaborn', 
+        'flask', 'pandas', 'pyarrow', 'numpy', 'scikit-learn', 'scipy',
+        'nltk', 'joblib', 'matplotlib', 'seaborn',
         'wordcloud', 'gunicorn'
     ]
     
     for package in required_packages:
-        if not check_python_package(package):
+        passed, line = package_status(package)
+        lines.append(line)
+        if not passed:
             all_checks_passed = False
     
+    emit(lines)
+    
     # Check model files
     print("\n🤖 Model Files:")
     if not check_model_files():